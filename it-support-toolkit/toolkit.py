@@ -7,23 +7,56 @@ A small, practical IT support CLI: sysinfo + network checks + support report exp
 from __future__ import annotations
 
 import argparse
+import asyncio
 import datetime as dt
+import functools
+import ipaddress
 import json
 import logging
 import os
 import platform
+import re
 import shutil
 import socket
-import subprocess
+import struct
 import sys
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 try:
     import psutil  # type: ignore
 except ImportError:
     psutil = None  # graceful fallback
 
+try:
+    import aiodns  # type: ignore
+except ImportError:
+    aiodns = None  # falls back to loop.getaddrinfo
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # falls back to stdlib json
+
+try:
+    import uvloop  # type: ignore
+except ImportError:
+    uvloop = None  # POSIX-only; Windows keeps the default ProactorEventLoop
+
+
+# ----------------------------
+# Platform (fixed for the process lifetime)
+# ----------------------------
+_IS_WINDOWS = sys.platform.startswith("win")
+_PING_FLAG = "-n" if _IS_WINDOWS else "-c"
+_FPING = shutil.which("fping")
+_OS_NAME = platform.system()
+_OS_VERSION = platform.version()
+_PYTHON_VERSION = platform.python_version()
+
 
 # ----------------------------
 # Logging
@@ -39,7 +72,7 @@ def setup_logging(verbose: bool) -> None:
 # ----------------------------
 # Data models
 # ----------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SysInfo:
     timestamp_utc: str
     hostname: str
@@ -52,156 +85,528 @@ class SysInfo:
     disk_free_gb: Optional[float]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NetCheck:
     local_ip: Optional[str]
-    dns_test: Dict[str, Any]
-    ping_test: Dict[str, Any]
+    dns_test: List[Dict[str, Any]]
+    ping_test: List[Dict[str, Any]]
+
+
+# Flat builders instead of dataclasses.asdict(), which deep-copies every field.
+def _sysinfo_dict(s: SysInfo) -> Dict[str, Any]:
+    return {
+        "timestamp_utc": s.timestamp_utc,
+        "hostname": s.hostname,
+        "os": s.os,
+        "os_version": s.os_version,
+        "python_version": s.python_version,
+        "cpu_count_logical": s.cpu_count_logical,
+        "memory_total_gb": s.memory_total_gb,
+        "disk_total_gb": s.disk_total_gb,
+        "disk_free_gb": s.disk_free_gb,
+    }
+
+
+def _netcheck_dict(n: NetCheck) -> Dict[str, Any]:
+    return {"local_ip": n.local_ip, "dns_test": n.dns_test, "ping_test": n.ping_test}
 
 
 # ----------------------------
 # Helpers
 # ----------------------------
+_UTC = dt.timezone.utc
+
+
+@functools.lru_cache(maxsize=1)
+def _utc_iso(epoch_s: int) -> str:
+    return dt.datetime.fromtimestamp(epoch_s, _UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def utc_now_iso() -> str:
-    return dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    # keyed on the whole second, so calls within the same second reuse the string
+    return _utc_iso(int(time.time()))
 
 
-def get_local_ip() -> Optional[str]:
-    """Best-effort local IP discovery."""
+def run_async(coro: Any) -> Any:
+    """Run a coroutine to completion on uvloop when installed, else asyncio's default loop."""
+    if uvloop:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def json_bytes(obj: Any) -> bytes:
+    """Serialize obj as indented UTF-8 JSON, using orjson when installed."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def print_json(obj: Any) -> None:
+    sys.stdout.flush()
+    sys.stdout.buffer.write(json_bytes(obj) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def _interface_ip() -> Optional[str]:
+    """
+    First IPv4 address of an interface that is up and not loopback/link-local.
+    Only used when there is no route: on multi-homed machines this can be a
+    virtual adapter rather than the outbound interface.
+    """
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(0.3)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
+        stats = psutil.net_if_stats()
+        for name, addrs in psutil.net_if_addrs().items():
+            if name not in stats or not stats[name].isup:
+                continue
+            for a in addrs:
+                if a.family != socket.AF_INET:
+                    continue
+                ip = ipaddress.ip_address(a.address)
+                if not (ip.is_loopback or ip.is_link_local):
+                    return a.address
+    except Exception:
+        pass
+    return None
+
+
+def _route_ip() -> Optional[str]:
+    """Source address the kernel picks for an outbound UDP 'connection' (no packets are sent)."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(0.3)
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
     except Exception:
         return None
 
 
-def run_cmd(cmd: List[str], timeout: int = 8) -> Tuple[int, str, str]:
+_LOCAL_IP_TTL = 60.0
+
+
+@functools.lru_cache(maxsize=1)
+def _local_ip(_ttl_bucket: int) -> Optional[str]:
+    return _route_ip() or (_interface_ip() if psutil else None)
+
+
+def get_local_ip() -> Optional[str]:
+    """Best-effort local IP discovery, cached for _LOCAL_IP_TTL seconds."""
+    return _local_ip(int(time.monotonic() // _LOCAL_IP_TTL))
+
+
+async def run_cmd(cmd: List[str], timeout: int = 8) -> Tuple[int, bytes, bytes]:
+    """Run cmd and return (code, stdout, stderr) as raw bytes; callers decode if needed."""
     try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        return proc.returncode, proc.stdout.strip(), proc.stderr.strip()
     except FileNotFoundError:
-        return 127, "", f"Command not found: {cmd[0]}"
-    except subprocess.TimeoutExpired:
-        return 124, "", f"Command timed out after {timeout}s: {' '.join(cmd)}"
+        return 127, b"", f"Command not found: {cmd[0]}".encode()
     except Exception as e:
-        return 1, "", f"Command error: {e}"
+        return 1, b"", f"Command error: {e}".encode()
+
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return 124, b"", f"Command timed out after {timeout}s: {' '.join(cmd)}".encode()
+    return proc.returncode, out, err
 
 
-def ping(host: str, count: int = 2) -> Dict[str, Any]:
+async def ping(host: str, count: int = 2, include_output: bool = False) -> Dict[str, Any]:
     """
     Cross-platform ping wrapper.
     Windows: ping -n <count>
     mac/linux: ping -c <count>
+    The command's stdout/stderr are only decoded into the result if include_output is set.
+    """
+    cmd = ["ping", _PING_FLAG, str(count), host]
+    code, out, err = await run_cmd(cmd, timeout=10)
+    res = {"host": host, "method": "ping", "ok": code == 0, "code": code}
+    if include_output:
+        res["stdout"] = out.decode("utf-8", "replace").strip()
+        res["stderr"] = err.decode("utf-8", "replace").strip()
+    return res
+
+
+_FPING_SUMMARY = re.compile(
+    r"^(?P<host>\S+)\s+: xmt/rcv/%loss = (?P<xmt>\d+)/(?P<rcv>\d+)/\d+%"
+    r"(?:, min/avg/max = [\d.]+/(?P<avg>[\d.]+)/[\d.]+)?"
+)
+
+
+async def fping(hosts: List[str], count: int = 2, include_output: bool = False) -> List[Dict[str, Any]]:
+    """
+    Ping all hosts with a single fping process and parse its per-host summary.
+    With include_output, each result also carries that host's stderr lines.
     """
-    is_windows = platform.system().lower().startswith("win")
-    cmd = ["ping", "-n" if is_windows else "-c", str(count), host]
-    code, out, err = run_cmd(cmd, timeout=10)
-    return {"host": host, "ok": code == 0, "code": code, "stdout": out, "stderr": err}
+    code, _, err_bytes = await run_cmd([_FPING, "-c", str(count), "-q", *hosts], timeout=10)
+    err_lines = err_bytes.decode("utf-8", "replace").strip().splitlines()
+    summaries = {}
+    for line in err_lines:
+        m = _FPING_SUMMARY.match(line)
+        if m:
+            summaries[m["host"]] = m
+
+    results = []
+    for h in hosts:
+        # "<host> : ..." exactly, so 8.8.8 does not pick up 8.8.8.8's line
+        host_re = re.compile(rf"{re.escape(h)}\s*:")
+        host_lines = [line for line in err_lines if host_re.match(line)]
+        m = summaries.get(h)
+        if m is None:
+            error = host_lines[0] if host_lines else f"No fping result (exit code {code})"
+            res = {"host": h, "method": "fping", "ok": False, "rtt_ms": None, "error": error}
+        else:
+            rtt_ms = float(m["avg"]) if m["avg"] else None
+            res = {"host": h, "method": "fping", "ok": int(m["rcv"]) > 0, "rtt_ms": rtt_ms,
+                   "sent": int(m["xmt"]), "received": int(m["rcv"])}
+        if include_output:
+            res["stderr"] = "\n".join(host_lines)
+        results.append(res)
+    return results
+
+
+async def tcp_probe(host: str, port: int = 443, timeout: float = 1.0) -> Dict[str, Any]:
+    """Reachability check via a TCP handshake; rtt_ms is the connect time."""
+    start = time.perf_counter()
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=timeout)
+    except asyncio.TimeoutError:
+        return {"host": host, "method": "tcp", "port": port, "ok": False, "rtt_ms": None,
+                "error": f"Connect timed out after {timeout}s"}
+    except OSError as e:
+        return {"host": host, "method": "tcp", "port": port, "ok": False, "rtt_ms": None, "error": str(e)}
+    rtt_ms = round((time.perf_counter() - start) * 1000, 2)
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return {"host": host, "method": "tcp", "port": port, "ok": True, "rtt_ms": rtt_ms}
+
+
+def _icmp_checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+async def _icmp_reply(loop: asyncio.AbstractEventLoop, sock: socket.socket, seq: int) -> None:
+    while True:
+        data = await loop.sock_recv(sock, 1024)
+        # macOS includes the IP header on ICMP datagram sockets, Linux does not.
+        if data and data[0] >> 4 == 4:
+            data = data[(data[0] & 0x0F) * 4:]
+        if len(data) >= 8:
+            icmp_type, _, _, _, reply_seq = struct.unpack("!BBHHH", data[:8])
+            if icmp_type == 0 and reply_seq == seq:
+                return
+
+
+@functools.lru_cache(maxsize=1)
+def _icmp_sockets_allowed() -> bool:
+    try:
+        socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP).close()
+        return True
+    except OSError:
+        return False
+
 
+async def icmp_probe(
+    host: str, count: int = 2, timeout: float = 1.0, include_output: bool = False
+) -> Dict[str, Any]:
+    """
+    ICMP echo over an unprivileged datagram socket (Linux ping_group_range, macOS).
+    Falls back to the ping binary when such sockets are not permitted.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except OSError as e:
+        LOG.debug("ICMP socket unavailable (%s), using ping binary", e)
+        return await ping(host, count, include_output)
 
-def dns_lookup(host: str) -> Dict[str, Any]:
     try:
-        infos = socket.getaddrinfo(host, None)
-        ips = sorted({i[4][0] for i in infos})
+        sock.setblocking(False)
+        infos = await loop.getaddrinfo(host, None, family=socket.AF_INET)
+        sock.connect((infos[0][4][0], 0))  # datagram connect only sets the peer, never blocks
+        ident = os.getpid() & 0xFFFF
+        rtts = []
+        for seq in range(1, count + 1):
+            payload = b"it-support-toolkit"
+            header = struct.pack("!BBHHH", 8, 0, 0, ident, seq)
+            packet = struct.pack("!BBHHH", 8, 0, _icmp_checksum(header + payload), ident, seq) + payload
+            start = time.perf_counter_ns()
+            await loop.sock_sendall(sock, packet)
+            try:
+                await asyncio.wait_for(_icmp_reply(loop, sock, seq), timeout=timeout)
+            except asyncio.TimeoutError:
+                continue
+            rtts.append((time.perf_counter_ns() - start) / 1e6)
+    except OSError as e:
+        return {"host": host, "method": "icmp", "ok": False, "rtt_ms": None, "error": str(e)}
+    finally:
+        sock.close()
+
+    rtt_ms = round(sum(rtts) / len(rtts), 2) if rtts else None
+    return {"host": host, "method": "icmp", "ok": bool(rtts), "rtt_ms": rtt_ms,
+            "sent": count, "received": len(rtts)}
+
+
+# aiodns needs a selector loop on Windows, which would break asyncio subprocesses
+# (ping), so it is only used on POSIX.
+_USE_AIODNS = aiodns is not None and not _IS_WINDOWS
+_RESOLVER: Optional[Tuple[asyncio.AbstractEventLoop, Any]] = None
+
+
+def _get_resolver() -> Any:
+    """Return the aiodns resolver bound to the running loop (created once per loop)."""
+    global _RESOLVER
+    loop = asyncio.get_running_loop()
+    if _RESOLVER is None or _RESOLVER[0] is not loop:
+        _RESOLVER = (loop, aiodns.DNSResolver(loop=loop))
+    return _RESOLVER[1]
+
+
+async def _resolve(host: str, family: int) -> Dict[str, Any]:
+    try:
+        if _USE_AIODNS:
+            res = await _get_resolver().getaddrinfo(host, family, type=socket.SOCK_STREAM)
+            addrs = (n.addr[0] for n in res.nodes)
+            ips = sorted({a.decode() if isinstance(a, bytes) else a for a in addrs})
+        else:
+            loop = asyncio.get_running_loop()
+            infos = await loop.getaddrinfo(host, None, family=family, type=socket.SOCK_STREAM)
+            ips = sorted({i[4][0] for i in infos})
         return {"host": host, "ok": True, "ips": ips}
     except Exception as e:
         return {"host": host, "ok": False, "error": str(e)}
 
 
+# In-process DNS cache: (host, family) -> (monotonic timestamp, result).
+# Failed lookups are kept for a shorter negative TTL. Lookups still in flight
+# are tracked separately so concurrent duplicates share a single query.
+DNS_TTL_DEFAULT = 300.0
+_DNS_NEGATIVE_TTL = 30.0
+_DNS_CACHE_MAX = 256
+_DNS_CACHE: "OrderedDict[Tuple[str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_DNS_INFLIGHT: Dict[Tuple[str, int], "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+async def _resolve_and_cache(key: Tuple[str, int], ttl: float) -> Dict[str, Any]:
+    try:
+        res = await _resolve(*key)
+    finally:
+        _DNS_INFLIGHT.pop(key, None)
+    if ttl > 0:
+        _DNS_CACHE[key] = (time.monotonic(), res)
+        while len(_DNS_CACHE) > _DNS_CACHE_MAX:
+            _DNS_CACHE.popitem(last=False)
+    return res
+
+
+async def dns_lookup(host: str, family: int = socket.AF_UNSPEC, ttl: float = DNS_TTL_DEFAULT) -> Dict[str, Any]:
+    """Resolve host, serving repeat lookups from the TTL cache (ttl <= 0 disables it)."""
+    key = (host, family)
+    hit = _DNS_CACHE.get(key)
+    if hit is not None:
+        ts, res = hit
+        max_age = ttl if res["ok"] else min(ttl, _DNS_NEGATIVE_TTL)
+        if time.monotonic() - ts < max_age:
+            _DNS_CACHE.move_to_end(key)
+            return dict(res)
+        del _DNS_CACHE[key]
+
+    task = _DNS_INFLIGHT.get(key)
+    if task is None:
+        task = _DNS_INFLIGHT[key] = asyncio.ensure_future(_resolve_and_cache(key, ttl))
+    # shield: one cancelled caller must not cancel the query others are awaiting
+    res = await asyncio.shield(task)
+    return dict(res)
+
+
+def _gather_results(hosts: List[str], results: List[Any]) -> List[Dict[str, Any]]:
+    """Turn exceptions returned by asyncio.gather into per-host error entries."""
+    return [
+        {"host": h, "ok": False, "error": str(r)} if isinstance(r, BaseException) else r
+        for h, r in zip(hosts, results)
+    ]
+
+
+async def dns_lookup_many(hosts: List[str], ttl: float = DNS_TTL_DEFAULT) -> List[Dict[str, Any]]:
+    results = await asyncio.gather(*(dns_lookup(h, ttl=ttl) for h in hosts), return_exceptions=True)
+    return _gather_results(hosts, results)
+
+
+async def ping_many(
+    hosts: List[str], use_icmp: bool = False, include_output: bool = False, port: int = 443
+) -> List[Dict[str, Any]]:
+    if use_icmp and _FPING and not _icmp_sockets_allowed():
+        # one fping process for all hosts instead of one ping per host
+        return await fping(hosts, include_output=include_output)
+    if use_icmp:
+        probes = [icmp_probe(h, include_output=include_output) for h in hosts]
+    else:
+        probes = [tcp_probe(h, port) for h in hosts]
+    results = await asyncio.gather(*probes, return_exceptions=True)
+    return _gather_results(hosts, results)
+
+
 # ----------------------------
 # Core features
 # ----------------------------
-def collect_sysinfo() -> SysInfo:
-    hostname = socket.gethostname()
-    os_name = platform.system()
-    os_version = platform.version()
-    pyver = platform.python_version()
-
-    cpu_count = None
-    mem_total_gb = None
-    disk_total_gb = None
-    disk_free_gb = None
-
+@functools.lru_cache(maxsize=1)
+def _static_sysinfo() -> Mapping[str, Any]:
+    """Fields that cannot change while the process runs; computed once."""
     if psutil:
         cpu_count = psutil.cpu_count(logical=True)
         mem_total_gb = round(psutil.virtual_memory().total / (1024**3), 2)
-        du = psutil.disk_usage(os.path.abspath(os.sep))
-        disk_total_gb = round(du.total / (1024**3), 2)
-        disk_free_gb = round(du.free / (1024**3), 2)
     else:
         # basic fallback if psutil isn't installed
         cpu_count = os.cpu_count()
-        total, used, free = shutil.disk_usage(os.path.abspath(os.sep))
-        disk_total_gb = round(total / (1024**3), 2)
-        disk_free_gb = round(free / (1024**3), 2)
-
-    return SysInfo(
-        timestamp_utc=utc_now_iso(),
-        hostname=hostname,
-        os=os_name,
-        os_version=os_version,
-        python_version=pyver,
-        cpu_count_logical=cpu_count,
-        memory_total_gb=mem_total_gb,
-        disk_total_gb=disk_total_gb,
-        disk_free_gb=disk_free_gb,
-    )
+        mem_total_gb = None
 
+    return MappingProxyType({
+        "hostname": socket.gethostname(),
+        "os": _OS_NAME,
+        "os_version": _OS_VERSION,
+        "python_version": _PYTHON_VERSION,
+        "cpu_count_logical": cpu_count,
+        "memory_total_gb": mem_total_gb,
+    })
 
-def run_netcheck(dns_host: str, ping_host: str) -> NetCheck:
-    lip = get_local_ip()
-    dns_res = dns_lookup(dns_host)
-    ping_res = ping(ping_host)
-    return NetCheck(local_ip=lip, dns_test=dns_res, ping_test=ping_res)
 
+def _disk_usage(path: str) -> Tuple[int, int]:
+    """(total, free) bytes for the filesystem holding path, from a single OS call."""
+    if _IS_WINDOWS:
+        import ctypes
+
+        total, free = ctypes.c_ulonglong(), ctypes.c_ulonglong()
+        if not ctypes.windll.kernel32.GetDiskFreeSpaceExW(
+            ctypes.c_wchar_p(path), None, ctypes.byref(total), ctypes.byref(free)
+        ):
+            raise ctypes.WinError()
+        return total.value, free.value
+    st = os.statvfs(path)
+    return st.f_blocks * st.f_frsize, st.f_bavail * st.f_frsize
+
+
+def _volatile_sysinfo() -> Dict[str, Any]:
+    """Fields re-read on every call (timestamp and disk usage)."""
+    total, free = _disk_usage(os.path.abspath(os.sep))
 
-def build_report(dns_host: str, ping_host: str) -> Dict[str, Any]:
-    sysinfo = collect_sysinfo()
-    net = run_netcheck(dns_host, ping_host)
     return {
-        "sysinfo": asdict(sysinfo),
-        "netcheck": asdict(net),
+        "timestamp_utc": utc_now_iso(),
+        "disk_total_gb": round(total / (1024**3), 2),
+        "disk_free_gb": round(free / (1024**3), 2),
     }
 
 
-def save_report(report: Dict[str, Any], out_prefix: str) -> Tuple[str, str]:
+def collect_sysinfo() -> SysInfo:
+    return SysInfo(**_static_sysinfo(), **_volatile_sysinfo())
+
+
+async def run_netcheck(
+    dns_hosts: List[str],
+    ping_hosts: List[str],
+    dns_ttl: float = DNS_TTL_DEFAULT,
+    use_icmp: bool = False,
+    verbose: bool = False,
+    port: int = 443,
+) -> NetCheck:
+    """Run the local-IP, DNS and ping probes concurrently (verbose keeps raw ping output)."""
+    loop = asyncio.get_running_loop()
+    lip, dns_res, ping_res = await asyncio.gather(
+        loop.run_in_executor(None, get_local_ip),
+        dns_lookup_many(dns_hosts, ttl=dns_ttl),
+        ping_many(ping_hosts, use_icmp, include_output=verbose, port=port),
+    )
+    return NetCheck(local_ip=lip, dns_test=dns_res, ping_test=ping_res)
+
+
+async def build_report(
+    dns_hosts: List[str],
+    ping_hosts: List[str],
+    dns_ttl: float = DNS_TTL_DEFAULT,
+    use_icmp: bool = False,
+    verbose: bool = False,
+    port: int = 443,
+) -> Tuple[SysInfo, NetCheck]:
+    """Collect everything a report needs; the result can be passed straight to save_report."""
+    sysinfo = collect_sysinfo()
+    net = await run_netcheck(dns_hosts, ping_hosts, dns_ttl, use_icmp, verbose, port)
+    return sysinfo, net
+
+
+def _report_json_chunks(sysinfo: SysInfo, net: NetCheck) -> List[bytes]:
+    """
+    The report JSON as separate pieces, so no combined report dict or
+    joined buffer is built. Each section is re-indented one level to match
+    what json_bytes() produces for the whole report.
+    """
+    return [
+        b'{\n  "sysinfo": ',
+        json_bytes(_sysinfo_dict(sysinfo)).replace(b"\n", b"\n  "),
+        b',\n  "netcheck": ',
+        json_bytes(_netcheck_dict(net)).replace(b"\n", b"\n  "),
+        b"\n}",
+    ]
+
+
+def _write_chunks(path: str, chunks: List[bytes]) -> None:
+    """Write chunks to path with raw os-level calls (no Python file object)."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        written = os.writev(fd, chunks) if hasattr(os, "writev") else 0
+        if written < sum(len(c) for c in chunks):
+            # no writev (Windows) or a short write: finish with plain os.write
+            view = memoryview(b"".join(chunks))[written:]
+            while view:
+                view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+async def save_report(sysinfo: SysInfo, net: NetCheck, out_prefix: str) -> Tuple[str, str]:
     json_path = out_prefix + ".json"
     txt_path = out_prefix + ".txt"
 
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
-
     # simple human-readable text summary
-    si = report["sysinfo"]
-    nc = report["netcheck"]
     lines = [
-        f"IT Support Report ({si['timestamp_utc']})",
+        f"IT Support Report ({sysinfo.timestamp_utc})",
         "-" * 40,
-        f"Host: {si['hostname']}",
-        f"OS: {si['os']} ({si['os_version']})",
-        f"Python: {si['python_version']}",
-        f"CPU (logical): {si['cpu_count_logical']}",
-        f"Memory total (GB): {si['memory_total_gb']}",
-        f"Disk total/free (GB): {si['disk_total_gb']} / {si['disk_free_gb']}",
+        f"Host: {sysinfo.hostname}",
+        f"OS: {sysinfo.os} ({sysinfo.os_version})",
+        f"Python: {sysinfo.python_version}",
+        f"CPU (logical): {sysinfo.cpu_count_logical}",
+        f"Memory total (GB): {sysinfo.memory_total_gb}",
+        f"Disk total/free (GB): {sysinfo.disk_total_gb} / {sysinfo.disk_free_gb}",
         "",
         "Network:",
-        f"Local IP: {nc['local_ip']}",
-        f"DNS lookup: {nc['dns_test']}",
-        f"Ping test: {nc['ping_test']['host']} ok={nc['ping_test']['ok']} code={nc['ping_test']['code']}",
+        f"Local IP: {net.local_ip}",
     ]
-    with open(txt_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
-
+    lines += [f"DNS lookup: {d}" for d in net.dns_test]
+    for pt in net.ping_test:
+        method = f" ({pt['method']})" if "method" in pt else ""
+        detail = f"code={pt['code']}" if "code" in pt else f"rtt_ms={pt.get('rtt_ms')}"
+        line = f"Ping test{method}: {pt['host']} ok={pt['ok']} {detail}"
+        if pt.get("error"):
+            line += f" error={pt['error']}"
+        lines.append(line)
+    txt_blob = (os.linesep.join(lines) + os.linesep).encode("utf-8")
+
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        loop.run_in_executor(None, _write_chunks, json_path, _report_json_chunks(sysinfo, net)),
+        loop.run_in_executor(None, _write_chunks, txt_path, [txt_blob]),
+    )
     return json_path, txt_path
 
 
@@ -210,21 +615,25 @@ def save_report(report: Dict[str, Any], out_prefix: str) -> Tuple[str, str]:
 # ----------------------------
 def cmd_sysinfo(_: argparse.Namespace) -> int:
     info = collect_sysinfo()
-    print(json.dumps(asdict(info), indent=2))
+    print_json(_sysinfo_dict(info))
     return 0
 
 
 def cmd_netcheck(args: argparse.Namespace) -> int:
-    net = run_netcheck(args.dns, args.ping)
-    print(json.dumps(asdict(net), indent=2))
+    net = run_async(run_netcheck(args.dns, args.ping, args.dns_ttl, args.use_icmp, args.verbose, args.port))
+    print_json(_netcheck_dict(net))
     return 0
 
 
+async def _report(args: argparse.Namespace, out_prefix: str) -> Tuple[str, str]:
+    sysinfo, net = await build_report(args.dns, args.ping, args.dns_ttl, args.use_icmp, args.verbose, args.port)
+    return await save_report(sysinfo, net, out_prefix)
+
+
 def cmd_report(args: argparse.Namespace) -> int:
-    report = build_report(args.dns, args.ping)
-    ts = dt.datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+    ts = dt.datetime.now(_UTC).strftime("%Y%m%d_%H%M%S")
     out_prefix = args.out or f"support_report_{ts}"
-    json_path, txt_path = save_report(report, out_prefix)
+    json_path, txt_path = run_async(_report(args, out_prefix))
     print(f"Wrote: {json_path}")
     print(f"Wrote: {txt_path}")
     return 0
@@ -239,14 +648,30 @@ def build_parser() -> argparse.ArgumentParser:
     s1 = sub.add_parser("sysinfo", help="Print system info as JSON")
     s1.set_defaults(func=cmd_sysinfo)
 
-    s2 = sub.add_parser("netcheck", help="Run DNS + ping checks")
-    s2.add_argument("--dns", default="google.com", help="Host to DNS-resolve")
-    s2.add_argument("--ping", default="8.8.8.8", help="Host/IP to ping")
+    s2 = sub.add_parser("netcheck", help="Run DNS + reachability checks")
+    s2.add_argument("--dns", nargs="+", default=["google.com"], help="Host(s) to DNS-resolve")
+    s2.add_argument("--ping", nargs="+", default=["8.8.8.8"], help="Host(s)/IP(s) to probe (TCP connect to --port)")
+    s2.add_argument("--port", type=int, default=443, help="TCP port for the reachability probe (default 443)")
+    s2.add_argument("--use-icmp", action="store_true", help="Probe with ICMP echo instead of TCP")
+    s2.add_argument(
+        "--dns-ttl",
+        type=float,
+        default=DNS_TTL_DEFAULT,
+        help="DNS cache TTL in seconds; the cache lasts only for this process (0 disables)",
+    )
     s2.set_defaults(func=cmd_netcheck)
 
     s3 = sub.add_parser("report", help="Generate JSON + TXT support report")
-    s3.add_argument("--dns", default="google.com", help="Host to DNS-resolve")
-    s3.add_argument("--ping", default="8.8.8.8", help="Host/IP to ping")
+    s3.add_argument("--dns", nargs="+", default=["google.com"], help="Host(s) to DNS-resolve")
+    s3.add_argument("--ping", nargs="+", default=["8.8.8.8"], help="Host(s)/IP(s) to probe (TCP connect to --port)")
+    s3.add_argument("--port", type=int, default=443, help="TCP port for the reachability probe (default 443)")
+    s3.add_argument("--use-icmp", action="store_true", help="Probe with ICMP echo instead of TCP")
+    s3.add_argument(
+        "--dns-ttl",
+        type=float,
+        default=DNS_TTL_DEFAULT,
+        help="DNS cache TTL in seconds; the cache lasts only for this process (0 disables)",
+    )
     s3.add_argument("--out", help="Output file prefix (no extension)")
     s3.set_defaults(func=cmd_report)
 